@@ -1,8 +1,18 @@
-import importlib.metadata
-
-__version__ = importlib.metadata.version("npg-python-lib")
+import functools
 
 
+@functools.cache
 def version() -> str:
     """Return the current version."""
-    return __version__
+    # Imported here because looking up distribution metadata is slow and is not
+    # needed by most importers of this package.
+    import importlib.metadata
+
+    return importlib.metadata.version("npg-python-lib")
+
+
+def __getattr__(name: str):
+    # Provides __version__ lazily, on first access
+    if name == "__version__":
+        return version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -16,18 +16,96 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import argparse
+import functools
 import sys
 from argparse import ArgumentParser
 from datetime import datetime, timedelta, timezone
 
-import dateutil.parser
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
 
 """This module provides utility functions for command line interfaces."""
 
 
-def add_date_range_arguments(parser: argparse, begin_delta=14):
+class _ParseTime:
+    """Holds a time shared by the date arguments of a parser, so that their defaults
+    for a parse are derived from a single timestamp.
+    """
+
+    def __init__(self):
+        self.now = None
+
+    def update(self) -> datetime:
+        """Set the shared time to the current time and return it."""
+        self.now = datetime.now(timezone.utc)
+        return self.now
+
+    def current(self) -> datetime:
+        """Return the shared time, setting it first if it has not been set."""
+        if self.now is None:
+            return self.update()
+        return self.now
+
+
+class _DateDefaultAction(argparse.Action):
+    """Stores a date argument whose default is relative to the time of parsing.
+
+    argparse reads an action's default when it starts parsing arguments, so making
+    the default a property allows it to be computed then, rather than when the parser
+    was built. This matters for long-running processes that build a parser once and
+    use it many times. An explicit default (e.g. from ArgumentParser.set_defaults)
+    takes precedence over the computed one.
+
+    Actions sharing a _ParseTime use the same timestamp. argparse reads defaults in
+    the order the actions were added, so the first action added (the leader) takes a
+    new timestamp whenever its default is read, and the others reuse it.
+    """
+
+    def __init__(
+        self,
+        option_strings,
+        dest,
+        parse_time: _ParseTime,
+        leader=False,
+        delta=timedelta(0),
+        **kwargs,
+    ):
+        self.parse_time = parse_time
+        self.leader = leader
+        self.delta = delta
+        super().__init__(option_strings, dest, **kwargs)
+
+    @property
+    def default(self):
+        # The leader takes a new timestamp even when it has an explicit default, so
+        # that the other actions do not reuse one from an earlier parse
+        if self.leader:
+            now = self.parse_time.update()
+        else:
+            now = self.parse_time.current()
+
+        if self._default is not None:
+            return self._default
+        return now - self.delta
+
+    @default.setter
+    def default(self, value):
+        self._default = value
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        setattr(namespace, self.dest, values)
+
+
+def add_date_range_arguments(parser: ArgumentParser, begin_delta=14) -> ArgumentParser:
     """Add --begin-date and --end-date arguments to the argument parser.
 
+    The default dates are computed each time arguments are parsed, rather than when
+    the arguments are added to the parser. Both are derived from the same time, so
+    the default range is exactly begin_delta days. This also holds when the arguments
+    are inherited by another parser through its 'parents' argument.
+
     Args:
         parser: The parser to modify
         begin_delta: The time delta for the default begin date relative to the default
@@ -36,14 +114,19 @@ def add_date_range_arguments(parser: argparse, begin_delta=14):
     Returns:
         The parser.
     """
+    parse_time = _ParseTime()
+
     parser.add_argument(
         "--begin-date",
         "--begin_date",
-        help="Limit to after this date. Defaults to 14 days ago. The argument must "
-        "be an ISO8601 UTC date or date and time "
+        help=f"Limit to after this date. Defaults to {begin_delta} days ago. The "
+        "argument must be an ISO8601 UTC date or date and time "
         "e.g. 2022-01-30, 2022-01-30T11:11:03Z",
         type=parse_iso_date,
-        default=datetime.now(timezone.utc) - timedelta(days=begin_delta),
+        action=_DateDefaultAction,
+        parse_time=parse_time,
+        leader=True,
+        delta=timedelta(days=begin_delta),
     )
     parser.add_argument(
         "--end-date",
@@ -52,9 +135,12 @@ def add_date_range_arguments(parser: argparse, begin_delta=14):
         "must be an ISO8601 UTC date or date and time "
         "e.g. 2022-01-30, 2022-01-30T11:11:03Z",
         type=parse_iso_date,
-        default=datetime.now(timezone.utc),
+        action=_DateDefaultAction,
+        parse_time=parse_time,
     )
 
+    return parser
+
 
 def add_db_config_arguments(parser: ArgumentParser) -> ArgumentParser:
     """Adds a database configuration argument to a parser.
@@ -111,12 +197,13 @@ def add_io_arguments(parser: ArgumentParser) -> ArgumentParser:
 def add_logging_arguments(parser: ArgumentParser) -> ArgumentParser:
     """Adds standard CLI logging arguments to a parser.
 
-    - --log-config Use a log configuration file (mutually exclusive with --debug,
-        --verbose, --colour and --json).
+    - --log-config Use a log configuration file (mutually exclusive with --debug and
+        --verbose).
     - -d/--debug   Enable DEBUG level logging to STDERR.
     - -v/--verbose Enable INFO level logging to STDERR.
-    - --colour     Use coloured log rendering to the console.
-    - --json       Use JSON log rendering.
+    - --colour     Use coloured log rendering to the console (mutually exclusive with
+        --json).
+    - --json       Use JSON log rendering (mutually exclusive with --colour).
 
     Args:
         parser: An argument parser to modify.
@@ -144,12 +231,13 @@ def add_logging_arguments(parser: ArgumentParser) -> ArgumentParser:
         action="store_true",
     )
 
-    parser.add_argument(
+    render_group = parser.add_mutually_exclusive_group()
+    render_group.add_argument(
         "--json",
         help="Use JSON log rendering.",
         action="store_true",
     )
-    parser.add_argument(
+    render_group.add_argument(
         "--colour",
         help="Use coloured log rendering to the console.",
         action="store_true",
@@ -158,8 +246,34 @@ def add_logging_arguments(parser: ArgumentParser) -> ArgumentParser:
     return parser
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_iso_date(date: str) -> datetime:
-    """Custom argparse type for ISO8601 dates."""
+    """Custom argparse type for ISO8601 dates.
+
+    If the optional ciso8601 package is installed, it is tried first because it is
+    the fastest parser available. Otherwise, the common forms are parsed with
+    datetime.fromisoformat, which is much faster than dateutil. Before Python 3.11
+    fromisoformat does not accept a trailing 'Z', so it is replaced with an explicit
+    UTC offset. Any other ISO8601 forms that fromisoformat rejects (e.g. the basic
+    format 20220130T111103Z) are passed to dateutil.
+
+    Results are cached because datetimes are immutable and callers parsing many
+    timestamps (e.g. from database rows) often see the same strings repeatedly.
+    """
+    if ciso8601 is not None:
+        try:
+            return ciso8601.parse_datetime(date)
+        except ValueError:
+            pass
+
+    iso = date[:-1] + "+00:00" if date.endswith("Z") else date
+    try:
+        return datetime.fromisoformat(iso)
+    except ValueError:
+        pass
+
+    import dateutil.parser
+
     try:
         return dateutil.parser.isoparse(date)
     except ValueError:
@@ -171,15 +285,17 @@ def parse_iso_date(date: str) -> datetime:
 def integer_in_range(minimum: int, maximum: int):
     """Custom argparse type for integers in a range."""
 
-    def check_range(value: str) -> int:
+    # The bounds are bound as default arguments so that they are local variables,
+    # rather than closure variables, in the returned function.
+    def check_range(value: str, _minimum=minimum, _maximum=maximum) -> int:
         try:
             val = int(value)
         except ValueError:
             raise argparse.ArgumentTypeError(f"Value {value} is not an integer")
 
-        if val < minimum or val > maximum:
+        if not _minimum <= val <= _maximum:
             raise argparse.ArgumentTypeError(
-                f"Value {val} is not in range {minimum} to {maximum}"
+                f"Value {val} is not in range {_minimum} to {_maximum}"
             )
         return val
 
@@ -17,7 +17,9 @@
 
 import configparser
 import dataclasses
+import functools
 import os
+import sys
 from dataclasses import dataclass
 from os import PathLike
 from pathlib import Path
@@ -39,6 +41,62 @@ class ParseError(Exception):
     pass
 
 
+def _read_ini(path: str) -> dict[str, dict[str, str]]:
+    """Return the values in an INI file, by section.
+
+    The values of each section include those inherited from the DEFAULT section. The
+    DEFAULT section itself is also included. Keys are folded to lower case, as by
+    ConfigParser.
+
+    Args:
+        path: The INI file path.
+
+    Returns:
+        A dict of section name to a dict of the section's keys and values.
+    """
+    # Interpolation is disabled because it is not used and because it is repeated
+    # on every value access. It also causes values containing '%' characters
+    # (e.g. passwords) to be rejected.
+    parser = configparser.ConfigParser(interpolation=None)
+
+    # Reading the whole file at once is cheaper than ConfigParser.read's line by line
+    # iteration and, unlike ConfigParser.read, reports why a file could not be read.
+    try:
+        text = Path(path).read_text(encoding="utf-8")
+    except OSError as e:
+        raise ParseError(f"Could not read '{path}': {e}") from e
+
+    parser.read_string(text, source=path)
+
+    # Copying each section's values into a plain dict once is cheaper than asking the
+    # parser for each value, which normalises the section and key on every call.
+    # Keys are interned so that lookups with the interned field names in IniData can
+    # succeed on an identity comparison.
+    return {
+        name: {sys.intern(key): val for key, val in parser.items(name, raw=True)}
+        for name in [parser.default_section, *parser.sections()]
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _load_ini(path: str, mtime_ns: int, size: int) -> dict[str, dict[str, str]]:
+    """Return the values in an INI file, by section, caching the result.
+
+    The modification time and size are part of the cache key so that a file is parsed
+    again after it changes. The returned dict is shared between callers and must not
+    be modified.
+
+    Args:
+        path: The INI file path.
+        mtime_ns: The modification time of the file, in nanoseconds.
+        size: The size of the file, in bytes.
+
+    Returns:
+        A dict of section name to a dict of the section's keys and values.
+    """
+    return _read_ini(path)
+
+
 class IniData:
     """A configuration class that reads values from an INI file to create an instance of
     a specified dataclass. Using a dataclass results in configuration that is easier
@@ -84,7 +142,15 @@ class IniData:
         parser = IniData(ServerConfig, use_env=True, env_prefix="SERVER_").
         obj = from_file("config.ini", "server")
 
-    All values are treated as strings.
+    All values are treated as strings and are not subject to interpolation.
+
+    Configuration dataclasses may be declared with @dataclass(slots=True), which
+    avoids a per-instance __dict__ and makes attribute access faster. This is
+    worthwhile where configuration is created frequently, e.g. per request.
+
+    Parsed INI files are cached, so reading several sections or dataclasses from the
+    same file parses it only once. A file is parsed again if its modification time or
+    size changes. Caching may be disabled with the 'cache' argument.
 
     The class provides INFO level logging of its actions to enable loading of
     configurations to be traced.
@@ -98,7 +164,18 @@ class IniData:
             admin-token: str = field(repr=False)
     """
 
-    def __init__(self, cls: D, use_env: bool = False, env_prefix: str = ""):
+    __slots__ = (
+        "_dataclass",
+        "use_env",
+        "env_prefix",
+        "cache",
+        "_fields",
+        "_field_keys",
+    )
+
+    def __init__(
+        self, cls: D, use_env: bool = False, env_prefix: str = "", cache: bool = True
+    ):
         """Makes a new configuration instance which can create instances of the
         dataclass 'D'.
 
@@ -113,15 +190,35 @@ class IniData:
                 Dataclass field names exist in the context of their class. However,
                 environment variables exist in a global context and can benefit from a
                 more descriptive name. The prefix can be used to provide that.
+            cache: If True, use a cached parse of the INI file when the file has not
+                changed since it was last read (as indicated by its modification time
+                and size). Defaults to True.
         """
         if dataclass is None:
             raise ValueError("A dataclass argument is required")
         if not dataclasses.is_dataclass(cls):
             raise ValueError(f"'{cls}' is not a dataclass")
 
-        self.dataclass = cls
+        self._dataclass = cls
         self.use_env = use_env
         self.env_prefix = env_prefix
+        self.cache = cache
+
+        # The fields of a dataclass are fixed, so they, and their INI keys, are
+        # resolved only once
+        self._fields = dataclasses.fields(cls)
+        self._field_keys = tuple(
+            sys.intern(field.name.lower()) for field in self._fields
+        )
+
+    @property
+    def dataclass(self):
+        """The dataclass bound to this configuration.
+
+        This is read-only because the dataclass fields are resolved when the
+        configuration is created.
+        """
+        return self._dataclass
 
     def from_file(
         self,
@@ -137,7 +234,7 @@ class IniData:
         Returns:
             A new dataclass instance with values populated from the INI file.
         """
-        p = Path(ini_file).resolve().absolute().as_posix()
+        p = os.fspath(Path(ini_file).resolve())
 
         log.info(
             "Reading configuration from file",
@@ -146,34 +243,34 @@ class IniData:
             dataclass=self.dataclass,
         )
 
-        parser = configparser.ConfigParser()
-        if not parser.read(p):
-            raise ParseError(f"Could not read '{p}'")
+        if self.cache:
+            try:
+                st = os.stat(p)
+            except OSError as e:
+                raise ParseError(f"Could not read '{p}': {e}") from e
 
-        kwargs = {}
-        for field in dataclasses.fields(self.dataclass):
-            if parser.has_option(section, field.name):
-                val = parser.get(section, field.name)
+            sections = _load_ini(p, st.st_mtime_ns, st.st_size)
+        else:
+            sections = _read_ini(p)
 
-                if val is None and self.use_env:
-                    env_var = self.env_prefix.upper() + field.name.upper()
-                    log.info(
-                        "Absent field; using an environment variable",
-                        path=p,
-                        section=section,
-                        field=field.name,
-                        env_var=env_var,
-                    )
+        values = sections.get(section, {})
 
-                    val = os.environ.get(env_var)
+        kwargs = {
+            field.name: values[key]
+            for field, key in zip(self._fields, self._field_keys)
+            if key in values
+        }
 
-                kwargs[field.name] = val
+        # Absent fields need further work only when environment variables are to be
+        # used, so the flag is checked once rather than for each absent field.
+        if self.use_env:
+            for field in self._fields:
+                if field.name in kwargs:
+                    continue
 
-            elif self.use_env:
                 env_var = self.env_prefix.upper() + field.name.upper()
-
                 log.debug(
-                    "Absent INI section; using an environment variable",
+                    "Absent field; using an environment variable",
                     path=p,
                     section=section,
                     field=field.name,
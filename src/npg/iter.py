@@ -27,7 +27,7 @@ def with_previous(iterable: Iterable) -> Iterable:
     a pair of None and the first item, the last tuple contains the pair of the last item
     and None. e.g.
 
-        [x for x in with_previous(range(3)] => [(None, 1), (1, 2), (2, None)]
+        [x for x in with_previous(range(3))] => [(None, 0), (0, 1), (1, 2), (2, None)]
 
     Args:
         iterable: An iterable to wrap.
@@ -35,7 +35,7 @@ def with_previous(iterable: Iterable) -> Iterable:
     Returns:
         An iterable of tuples.
     """
-    lead, lag = itertools.tee(iterable, 2)
-    return itertools.zip_longest(
-        itertools.chain(iter([None]), lead), lag, fillvalue=None
-    )
+    # The two copies are consumed in step, one item apart, so tee buffers at most one
+    # item. Keeping the loop in itertools and zip avoids per-item bytecode.
+    prev, curr = itertools.tee(iterable, 2)
+    return zip(itertools.chain([None], prev), itertools.chain(curr, [None]))
@@ -17,14 +17,97 @@
 
 import json as json_parser
 import logging.config
+from pathlib import Path
 
 import structlog
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 """This module provides utility functions for logging."""
 
 
+# The processor pipeline (and comments) are taken from the structlog
+# documentation "Rendering within structlog":
+#
+# "This is the simplest approach where structlog does all the heavy
+# lifting and passes a fully-formatted string to logging."
+#
+# The processors are stateless, so they are created once and shared by every call to
+# configure_structlog. The remaining processors are appended per call.
+_BASE_PROCESSORS = (
+    # If log level is too low, abort pipeline and throw away log entry.
+    structlog.stdlib.filter_by_level,
+    # Add the name of the logger to event dict.
+    structlog.stdlib.add_logger_name,
+    # Add log level to event dict.
+    structlog.stdlib.add_log_level,
+    # Perform %-style formatting.
+    structlog.stdlib.PositionalArgumentsFormatter(),
+    # Add a timestamp in ISO 8601 format.
+    structlog.processors.TimeStamper(fmt="iso", utc=True),  # UTC added by kdj
+    # If the "stack_info" key in the event dict is true, remove it and
+    # render the current stack trace in the "stack" key.
+    structlog.processors.StackInfoRenderer(),
+    # If the "exc_info" key in the event dict is either true or a
+    # sys.exc_info() tuple, remove "exc_info" and render the exception
+    # with traceback into the "exception" key.
+    structlog.processors.format_exc_info,
+    # structlog.processors.dict_tracebacks,
+    # If some value is in bytes, decode it to a unicode str.
+    structlog.processors.UnicodeDecoder(),
+)
+
+# Add call site parameters. This inspects the stack for every log entry that passes
+# the level filter, which makes it one of the most expensive processors. It is
+# therefore only added to the pipeline on request.
+_CALLSITE_PROCESSOR = structlog.processors.CallsiteParameterAdder(
+    {
+        structlog.processors.CallsiteParameter.FILENAME,
+        structlog.processors.CallsiteParameter.FUNC_NAME,
+        structlog.processors.CallsiteParameter.LINENO,
+    }
+)
+
+
+def _orjson_dumps(obj, **kwargs) -> str:
+    """Serialize to a JSON string with orjson, for use by structlog's JSONRenderer.
+
+    orjson returns bytes, which the standard library logging (into which structlog
+    sends its messages) would render as a bytes literal, so they are decoded here.
+
+    orjson natively serializes some types that the standard library json module
+    passes to the default handler (e.g. dataclasses, datetimes and subclasses of str,
+    int, dict and list). These are passed through to the default handler so that the
+    output does not depend on whether orjson is installed, and so that dataclass
+    fields declared with repr=False (e.g. secrets) are not logged.
+
+    orjson rejects some values that the standard library json module accepts (e.g.
+    integers outside the 64-bit range) without passing them to the default handler.
+    Such events are serialized with the json module instead.
+    """
+    try:
+        return orjson.dumps(
+            obj,
+            default=kwargs.get("default"),
+            option=orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_SUBCLASS,
+        ).decode("utf-8")
+    except orjson.JSONEncodeError:
+        return json_parser.dumps(obj, **kwargs)
+
+
 def configure_structlog(
-    config_file=None, debug=False, verbose=False, colour=False, json=False
+    config_file=None,
+    debug=False,
+    verbose=False,
+    colour=False,
+    json=False,
+    callsite=False,
 ):
     """Configure logging with a file, or individual parameters.
 
@@ -39,6 +122,9 @@ def configure_structlog(
 
     See https://docs.python.org/3/library/logging.config.html#configuration-dictionary-schema
 
+    If the optional orjson package is installed, it is used to load the configuration
+    file and to render JSON logs, otherwise the standard library json module is used.
+
         Args:
             config_file: A file path. Optional. If provided, the debug and verbose
                 keywords are ignored in favour of the settings in the file.
@@ -48,51 +134,20 @@ def configure_structlog(
             colour: Set to True for colour logging. Defaults to False.
             json: Set to True for JSON structured logs. Defaults to False and
               overrides colour if set.
+            callsite: Set to True to add the file name, function name and line
+              number of the call site to each log entry. Defaults to False because
+              this requires inspecting the stack for every log entry.
 
         Returns:
             Void
     """
-    # The processor pipeline (and comments) are taken from the structlog
-    # documentation "Rendering within structlog":
-    #
-    # "This is the simplest approach where structlog does all the heavy
-    # lifting and passes a fully-formatted string to logging."
-
-    log_processors = [
-        # If log level is too low, abort pipeline and throw away log entry.
-        structlog.stdlib.filter_by_level,
-        # Add the name of the logger to event dict.
-        structlog.stdlib.add_logger_name,
-        # Add log level to event dict.
-        structlog.stdlib.add_log_level,
-        # Perform %-style formatting.
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        # Add a timestamp in ISO 8601 format.
-        structlog.processors.TimeStamper(fmt="iso", utc=True),  # UTC added by kdj
-        # If the "stack_info" key in the event dict is true, remove it and
-        # render the current stack trace in the "stack" key.
-        structlog.processors.StackInfoRenderer(),
-        # If the "exc_info" key in the event dict is either true or a
-        # sys.exc_info() tuple, remove "exc_info" and render the exception
-        # with traceback into the "exception" key.
-        structlog.processors.format_exc_info,
-        # structlog.processors.dict_tracebacks,
-        # If some value is in bytes, decode it to a unicode str.
-        structlog.processors.UnicodeDecoder(),
-        # Add call site parameters.
-        structlog.processors.CallsiteParameterAdder(
-            {
-                structlog.processors.CallsiteParameter.FILENAME,
-                structlog.processors.CallsiteParameter.FUNC_NAME,
-                structlog.processors.CallsiteParameter.LINENO,
-            }
-        ),
-    ]
-
     if config_file is not None:
-        with open(config_file, "rb") as f:
-            conf = json_parser.load(f)
-            logging.config.dictConfig(conf)
+        data = Path(config_file).read_bytes()
+        if orjson is not None:
+            conf = orjson.loads(data)
+        else:
+            conf = json_parser.loads(data)
+        logging.config.dictConfig(conf)
     else:
         level = logging.ERROR
         if debug:
@@ -102,8 +157,15 @@ def configure_structlog(
 
         logging.basicConfig(level=level, encoding="utf-8")
 
+    log_processors = list(_BASE_PROCESSORS)
+    if callsite:
+        log_processors.append(_CALLSITE_PROCESSOR)
     if json:
-        log_processors.append(structlog.processors.JSONRenderer())
+        if orjson is not None:
+            renderer = structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+        else:
+            renderer = structlog.processors.JSONRenderer()
+        log_processors.append(renderer)
     else:
         log_processors.append(structlog.dev.ConsoleRenderer(colors=colour))
 
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import argparse
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+from pytest import mark as m
+
+from npg.cli import (
+    add_date_range_arguments,
+    add_logging_arguments,
+    integer_in_range,
+    parse_iso_date,
+)
+
+
+@m.describe("parse_iso_date")
+class TestParseIsoDate:
+    @m.it("Parses a date")
+    def test_parse_date(self):
+        assert parse_iso_date("2022-01-30") == datetime(2022, 1, 30)
+
+    @m.it("Parses a UTC date and time with a Z suffix")
+    def test_parse_utc_z(self):
+        assert parse_iso_date("2022-01-30T11:11:03Z") == datetime(
+            2022, 1, 30, 11, 11, 3, tzinfo=timezone.utc
+        )
+
+    @m.it("Parses a date and time with an explicit offset")
+    def test_parse_offset(self):
+        assert parse_iso_date("2022-01-30T11:11:03+00:00") == datetime(
+            2022, 1, 30, 11, 11, 3, tzinfo=timezone.utc
+        )
+
+    @m.it("Parses a date and time in ISO8601 basic format")
+    def test_parse_basic_format(self):
+        assert parse_iso_date("20220130T111103Z") == datetime(
+            2022, 1, 30, 11, 11, 3, tzinfo=timezone.utc
+        )
+
+    @m.it("Raises an ArgumentTypeError on invalid input")
+    def test_parse_invalid(self):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_iso_date("not a date")
+
+    @m.context("When ciso8601 is not installed")
+    @m.it("Parses dates in all supported formats")
+    def test_parse_without_ciso8601(self):
+        expected = datetime(2022, 1, 30, 11, 11, 3, tzinfo=timezone.utc)
+
+        parse_iso_date.cache_clear()
+        try:
+            with patch("npg.cli.ciso8601", None):
+                assert parse_iso_date("2022-01-30") == datetime(2022, 1, 30)
+                assert parse_iso_date("2022-01-30T11:11:03Z") == expected
+                assert parse_iso_date("20220130T111103Z") == expected
+                with pytest.raises(argparse.ArgumentTypeError):
+                    parse_iso_date("not a date")
+        finally:
+            parse_iso_date.cache_clear()
+
+    @m.it("Returns the same instance for repeated input")
+    def test_parse_cached(self):
+        date = "2022-01-30T11:11:03Z"
+        assert parse_iso_date(date) is parse_iso_date(date)
+
+
+@m.describe("add_date_range_arguments")
+class TestAddDateRangeArguments:
+    @m.context("When no dates are given")
+    @m.it("Defaults to a range of begin_delta days ending now")
+    def test_default_range(self):
+        parser = argparse.ArgumentParser()
+        add_date_range_arguments(parser, begin_delta=7)
+        args = parser.parse_args([])
+
+        assert args.end_date - args.begin_date == timedelta(days=7)
+        assert args.end_date <= datetime.now(timezone.utc)
+
+    @m.context("When no dates are given")
+    @m.it("Computes the default dates when the arguments are parsed")
+    def test_default_at_parse_time(self):
+        parser = argparse.ArgumentParser()
+        add_date_range_arguments(parser, begin_delta=7)
+
+        before = datetime.now(timezone.utc)
+        args = parser.parse_args([])
+
+        assert args.end_date >= before
+        assert args.begin_date >= before - timedelta(days=7)
+
+    @m.context("When the arguments are added to a subparser")
+    @m.it("Defaults to a range of begin_delta days ending now")
+    def test_default_range_subparser(self):
+        parser = argparse.ArgumentParser()
+        subparsers = parser.add_subparsers(dest="command")
+        add_date_range_arguments(subparsers.add_parser("report"), begin_delta=7)
+        args = parser.parse_args(["report"])
+
+        assert args.end_date - args.begin_date == timedelta(days=7)
+
+    @m.context("When the arguments are inherited from a parent parser")
+    @m.it("Defaults to a range of begin_delta days ending now")
+    def test_default_range_parents(self):
+        parent = argparse.ArgumentParser(add_help=False)
+        add_date_range_arguments(parent, begin_delta=7)
+        parser = argparse.ArgumentParser(parents=[parent])
+
+        for _ in range(100):
+            args = parser.parse_args([])
+            assert args.end_date - args.begin_date == timedelta(days=7)
+
+    @m.context("When only the begin date is given")
+    @m.it("Defaults the end date to the time of parsing")
+    def test_default_end_date(self):
+        parser = argparse.ArgumentParser()
+        add_date_range_arguments(parser)
+        parser.parse_args([])
+
+        before = datetime.now(timezone.utc)
+        args = parser.parse_args(["--begin-date", "2022-01-01"])
+
+        assert args.begin_date == datetime(2022, 1, 1)
+        assert args.end_date >= before
+
+    @m.context("When explicit defaults are set on the parser")
+    @m.it("Uses the explicit defaults")
+    def test_explicit_defaults(self):
+        parser = argparse.ArgumentParser()
+        add_date_range_arguments(parser)
+        begin = datetime(2022, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2022, 1, 30, tzinfo=timezone.utc)
+        parser.set_defaults(begin_date=begin, end_date=end)
+        args = parser.parse_args([])
+
+        assert args.begin_date == begin
+        assert args.end_date == end
+
+    @m.context("When dates are given")
+    @m.it("Parses the dates")
+    def test_explicit_range(self):
+        parser = argparse.ArgumentParser()
+        add_date_range_arguments(parser)
+        args = parser.parse_args(
+            ["--begin-date", "2022-01-01", "--end-date", "2022-01-30T11:11:03Z"]
+        )
+
+        assert args.begin_date == datetime(2022, 1, 1)
+        assert args.end_date == datetime(2022, 1, 30, 11, 11, 3, tzinfo=timezone.utc)
+
+
+@m.describe("integer_in_range")
+class TestIntegerInRange:
+    @m.it("Returns integers within the range, inclusive")
+    def test_in_range(self):
+        check_range = integer_in_range(-1, 10)
+        assert check_range("-1") == -1
+        assert check_range("5") == 5
+        assert check_range("10") == 10
+
+    @m.it("Raises an ArgumentTypeError for integers outside the range")
+    def test_out_of_range(self):
+        check_range = integer_in_range(-1, 10)
+        for value in ["-2", "11"]:
+            with pytest.raises(argparse.ArgumentTypeError):
+                check_range(value)
+
+    @m.it("Raises an ArgumentTypeError for non-integers")
+    def test_non_integer(self):
+        check_range = integer_in_range(-1, 10)
+        for value in ["", "1.5", "one"]:
+            with pytest.raises(argparse.ArgumentTypeError):
+                check_range(value)
+
+
+@m.describe("add_logging_arguments")
+class TestAddLoggingArguments:
+    @m.context("When compatible arguments are given")
+    @m.it("Parses the arguments")
+    def test_compatible_arguments(self):
+        parser = argparse.ArgumentParser()
+        add_logging_arguments(parser)
+        args = parser.parse_args(["--debug", "--json"])
+
+        assert args.debug
+        assert args.json
+        assert not args.colour
+
+        # The rendering is not set by a log configuration file, so may be combined
+        args = parser.parse_args(["--log-config", "log.json", "--colour"])
+
+        assert args.log_config == "log.json"
+        assert args.colour
+
+    @m.context("When conflicting arguments are given")
+    @m.it("Exits with an error")
+    def test_conflicting_arguments(self):
+        parser = argparse.ArgumentParser()
+        add_logging_arguments(parser)
+
+        for argv in [
+            ["--log-config", "log.json", "--debug"],
+            ["--log-config", "log.json", "--verbose"],
+            ["--debug", "--verbose"],
+            ["--colour", "--json"],
+        ]:
+            with pytest.raises(SystemExit):
+                parser.parse_args(argv)
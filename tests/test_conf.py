@@ -16,9 +16,9 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import logging
+import os
 from dataclasses import dataclass, field
 from typing import Optional
-from unittest.mock import patch
 
 import pytest
 from pytest import mark as m
@@ -27,7 +27,7 @@ from structlog.testing import capture_logs
 from npg.conf import IniData, ParseError
 
 
-@dataclass
+@dataclass(slots=True)
 class ExampleConfig:
     """An example dataclass for testing."""
 
@@ -42,6 +42,58 @@ class NonDataclass:
     pass
 
 
+@pytest.fixture(scope="class")
+def standard_ini(tmp_path_factory):
+    """An INI file with a 'test' section containing all the ExampleConfig fields.
+
+    The file is shared by the tests in a class and must not be modified.
+    """
+    ini_file = tmp_path_factory.mktemp("conf") / "config.ini"
+    ini_file.write_text("[test]\nsecret=SECRET_VALUE\nkey1=value1\nkey2=value2\n")
+
+    return ini_file
+
+
+@pytest.fixture(scope="class")
+def partial_ini(tmp_path_factory):
+    """An INI file with a 'test' section containing only the required ExampleConfig
+    fields.
+
+    The file is shared by the tests in a class and must not be modified.
+    """
+    ini_file = tmp_path_factory.mktemp("conf") / "config.ini"
+    ini_file.write_text("[test]\nsecret=SECRET_VALUE\nkey1=value1\n")
+
+    return ini_file
+
+
+def set_env(name: str, value: str):
+    """Set an environment variable, yield its value and then restore the variable's
+    original state.
+    """
+    original = os.environ.get(name)
+    os.environ[name] = value
+    try:
+        yield value
+    finally:
+        if original is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = original
+
+
+@pytest.fixture
+def env_key2():
+    """Sets the environment variable KEY2 for the duration of a test."""
+    yield from set_env("KEY2", "environment_value2")
+
+
+@pytest.fixture
+def env_example_key2():
+    """Sets the environment variable EXAMPLE_KEY2 for the duration of a test."""
+    yield from set_env("EXAMPLE_KEY2", "environment_value2")
+
+
 @m.describe("IniData")
 class TestIniData:
     @m.context("When the INI file is missing")
@@ -65,20 +117,89 @@ class TestIniData:
         with pytest.raises(ValueError):
             IniData(NonDataclass)
 
+    @m.context("When the dataclass is changed after construction")
+    @m.it("Raises an AttributeError")
+    def test_dataclass_read_only(self):
+        parser = IniData(ExampleConfig)
+        with pytest.raises(AttributeError):
+            parser.dataclass = NonDataclass
+
     @m.context("When the INI file is present")
     @m.it("Populates a dataclass")
-    def test_populate_from_ini_file(self, tmp_path):
+    def test_populate_from_ini_file(self, standard_ini):
+        parser = IniData(ExampleConfig)
+        assert parser.from_file(standard_ini, "test") == ExampleConfig(
+            key1="value1", key2="value2", secret="SECRET_VALUE"
+        )
+
+    @m.context("When the INI file is changed after being read")
+    @m.it("Populates a dataclass from the changed file")
+    def test_changed_ini_file(self, tmp_path):
+        ini_file = tmp_path / "config.ini"
+        section = "test"
+        ini_file.write_text(f"[{section}]\nsecret=SECRET_VALUE\nkey1=value1\n")
+
+        parser = IniData(ExampleConfig)
+        assert parser.from_file(ini_file, section).key1 == "value1"
+
+        ini_file.write_text(f"[{section}]\nsecret=SECRET_VALUE\nkey1=value2\n")
+        st = ini_file.stat()
+        os.utime(ini_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert parser.from_file(ini_file, section).key1 == "value2"
+
+    @m.context("When caching is disabled")
+    @m.it("Populates a dataclass from the changed file")
+    def test_changed_ini_file_no_cache(self, tmp_path):
+        ini_file = tmp_path / "config.ini"
+        section = "test"
+        ini_file.write_text(f"[{section}]\nsecret=SECRET_VALUE\nkey1=value1\n")
+        st = ini_file.stat()
+
+        parser = IniData(ExampleConfig, cache=False)
+        assert parser.from_file(ini_file, section).key1 == "value1"
+
+        # Same size and modification time, so only an uncached read sees the change
+        ini_file.write_text(f"[{section}]\nsecret=SECRET_VALUE\nkey1=value2\n")
+        os.utime(ini_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert parser.from_file(ini_file, section).key1 == "value2"
+
+    @m.context("When caching is disabled and the INI file is missing")
+    @m.it("Raises a ParseError")
+    def test_missing_ini_file_no_cache(self, tmp_path):
+        ini_file = tmp_path / "missing.ini"
+
+        parser = IniData(ExampleConfig, cache=False)
+        with pytest.raises(ParseError):
+            parser.from_file(ini_file, "section")
+
+    @m.context("When a value contains a '%' character")
+    @m.it("Populates a dataclass without interpolation")
+    def test_no_interpolation(self, tmp_path):
+        ini_file = tmp_path / "config.ini"
+        section = "test"
+        secret = "SECRET%VALUE%(key1)s"
+        ini_file.write_text(f"[{section}]\nsecret={secret}\nkey1=value1\n")
+
+        parser = IniData(ExampleConfig)
+        assert parser.from_file(ini_file, section) == ExampleConfig(
+            key1="value1", secret=secret
+        )
+
+    @m.context("When a value is in the DEFAULT section")
+    @m.it("Populates a dataclass with the default value")
+    def test_default_section_value(self, tmp_path):
         ini_file = tmp_path / "config.ini"
         section = "test"
         val1 = "value1"
-        val2 = "value2"
         ini_file.write_text(
-            f"[{section}]\nsecret=SECRET_VALUE\nkey1={val1}\nkey2={val2}\n"
+            f"[DEFAULT]\nkey2=default2\n[{section}]\nsecret=SECRET_VALUE\nkey1={val1}\n"
         )
 
         parser = IniData(ExampleConfig)
         assert parser.from_file(ini_file, section) == ExampleConfig(
-            key1=val1, key2=val2, secret="SECRET_VALUE"
+            key1=val1, key2="default2", secret="SECRET_VALUE"
         )
 
     @m.context("When a field required by the dataclass is absent")
@@ -95,11 +216,10 @@ class TestIniData:
 
     @m.context("When an optional field is absent")
     @m.it("Populates a dataclass")
-    def test_missing_non_required_value(self, tmp_path):
-        ini_file = tmp_path / "config.ini"
+    def test_missing_non_required_value(self, partial_ini):
+        ini_file = partial_ini
         section = "test"
         val1 = "value1"
-        ini_file.write_text(f"[{section}]\nsecret=SECRET_VALUE\nkey1={val1}\n")
 
         parser = IniData(ExampleConfig)
         assert parser.from_file(ini_file, section) == ExampleConfig(
@@ -108,49 +228,49 @@ class TestIniData:
 
     @m.context("When environment variables are not to be used")
     @m.it("Does not fall back to environment variables when a field is absent")
-    def test_no_env_fallback(self, tmp_path):
-        ini_file = tmp_path / "config.ini"
+    def test_no_env_fallback(self, partial_ini, env_key2):
+        ini_file = partial_ini
         section = "test"
         val1 = "value1"
-        ini_file.write_text(f"[{section}]\nsecret=SECRET_VALUE\nkey1={val1}\n")
 
-        env_val2 = "environment_value2"
-        with patch.dict("os.environ", {"KEY2": env_val2}):
-            parser = IniData(ExampleConfig, use_env=False)
-            assert parser.from_file(ini_file, section) == ExampleConfig(
-                secret="SECRET_VALUE", key1=val1, key2=None
-            )
+        parser = IniData(ExampleConfig, use_env=False)
+        assert parser.from_file(ini_file, section) == ExampleConfig(
+            secret="SECRET_VALUE", key1=val1, key2=None
+        )
 
     @m.context("When environment variables are to be used")
     @m.it("Falls back to environment variables when a field is absent")
-    def test_env_fallback(self, tmp_path):
-        ini_file = tmp_path / "config.ini"
+    def test_env_fallback(self, partial_ini, env_key2):
+        ini_file = partial_ini
         section = "test"
         val1 = "value1"
-        ini_file.write_text(f"[{section}]\nsecret=SECRET_VALUE\nkey1={val1}\n")
 
-        env_val2 = "environment_value2"
-        with patch.dict("os.environ", {"KEY2": env_val2}):
-            parser = IniData(ExampleConfig, use_env=True)
-            assert parser.from_file(ini_file, section) == ExampleConfig(
-                key1=val1, key2=env_val2, secret="SECRET_VALUE"
-            )
+        parser = IniData(ExampleConfig, use_env=True)
+        assert parser.from_file(ini_file, section) == ExampleConfig(
+            key1=val1, key2=env_key2, secret="SECRET_VALUE"
+        )
 
     @m.context("When environment variables are to be used with a prefix")
     @m.it("Falls back to environment variables with a prefix when a field is absent")
-    def test_env_fallback_with_prefix(self, tmp_path):
-        ini_file = tmp_path / "config.ini"
+    def test_env_fallback_with_prefix(self, partial_ini, env_example_key2):
+        ini_file = partial_ini
         section = "test"
         val1 = "value1"
-        ini_file.write_text(f"[{section}]\nsecret=SECRET_VALUE\nkey1={val1}\n")
 
-        env_val2 = "environment_value2"
+        parser = IniData(ExampleConfig, use_env=True, env_prefix="EXAMPLE_")
+        assert parser.from_file(ini_file, section) == ExampleConfig(
+            key1=val1, key2=env_example_key2, secret="SECRET_VALUE"
+        )
 
-        with patch.dict("os.environ", {"EXAMPLE_KEY2": env_val2}):
-            parser = IniData(ExampleConfig, use_env=True, env_prefix="EXAMPLE_")
-            assert parser.from_file(ini_file, section) == ExampleConfig(
-                key1=val1, key2=env_val2, secret="SECRET_VALUE"
-            )
+    @m.context("When the environment variable prefix is changed after construction")
+    @m.it("Falls back to environment variables with the new prefix")
+    def test_env_fallback_with_changed_prefix(self, partial_ini, env_example_key2):
+        parser = IniData(ExampleConfig, use_env=True, env_prefix="OTHER_")
+        parser.env_prefix = "EXAMPLE_"
+
+        assert parser.from_file(partial_ini, "test") == ExampleConfig(
+            key1="value1", key2=env_example_key2, secret="SECRET_VALUE"
+        )
 
     @m.context("When the configuration class includes a secret field")
     @m.it("Does not include the secret field in the representation")
@@ -162,12 +282,10 @@ class TestIniData:
 
     @m.context("When the configuration class includes a secret field")
     @m.it("Does not include the secret field in the debug log")
-    def test_secret_debug(self, tmp_path, caplog):
-        ini_file = tmp_path / "config.ini"
+    def test_secret_debug(self, partial_ini, caplog):
+        ini_file = partial_ini
         section = "test"
-        val1 = "value1"
         secret = "SECRET_VALUE"
-        ini_file.write_text(f"[{section}]\nsecret={secret}\nkey1={val1}\n")
 
         with caplog.at_level(logging.DEBUG):
             with capture_logs() as cap_logs:
@@ -46,3 +46,9 @@ class TestWithPrevious:
         result = list(with_previous([None, 1, None]))
         expected = [(None, None), (None, 1), (1, None), (None, None)]
         assert result == expected
+
+    @m.it("Handles a single-pass iterator")
+    def test_handles_single_pass_iterator(self):
+        result = list(with_previous(x for x in range(3)))
+        expected = [(None, 0), (0, 1), (1, 2), (2, None)]
+        assert result == expected
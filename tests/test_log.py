@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Genome Research Ltd. All rights reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+import structlog
+from pytest import mark as m
+
+from npg.log import configure_structlog
+
+
+@dataclass
+class SecretConfig:
+    """An example dataclass with a secret field for testing."""
+
+    user: str
+    secret: str = field(repr=False)
+
+
+@pytest.fixture
+def reset_structlog():
+    """Restore the default structlog configuration after a test."""
+    yield
+    structlog.reset_defaults()
+
+
+@pytest.fixture
+def config_logger():
+    """Provide the name of a logger that a test may configure, restoring the logger's
+    level after the test.
+    """
+    name = "test_config_logger"
+    logger = logging.getLogger(name)
+    level = logger.level
+    yield name
+    logger.setLevel(level)
+
+
+def write_config(path, logger_name: str):
+    """Write a logging configuration file that sets a logger's level to WARNING."""
+    path.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "incremental": True,
+                "loggers": {logger_name: {"level": "WARNING"}},
+            }
+        )
+    )
+
+
+def log_entry(caplog, event: str) -> dict:
+    """Return the JSON log entry for an event."""
+    for record in caplog.records:
+        entry = json.loads(record.getMessage())
+        if entry["event"] == event:
+            return entry
+
+    raise ValueError(f"No log entry for event '{event}'")
+
+
+@m.describe("configure_structlog")
+class TestConfigureStructlog:
+    @m.context("When call site parameters are not requested")
+    @m.it("Does not add call site parameters to log entries")
+    def test_no_callsite(self, caplog, reset_structlog):
+        configure_structlog(json=True)
+
+        with caplog.at_level(logging.INFO):
+            structlog.get_logger("test_no_callsite").info("No call site")
+
+        entry = log_entry(caplog, "No call site")
+        assert "lineno" not in entry
+        assert "func_name" not in entry
+        assert "filename" not in entry
+
+    @m.context("When call site parameters are requested")
+    @m.it("Adds call site parameters to log entries")
+    def test_callsite(self, caplog, reset_structlog):
+        configure_structlog(json=True, callsite=True)
+
+        with caplog.at_level(logging.INFO):
+            structlog.get_logger("test_callsite").info("Call site")
+
+        entry = log_entry(caplog, "Call site")
+        assert entry["func_name"] == "test_callsite"
+        assert entry["filename"] == "test_log.py"
+
+    @m.context("When rendering JSON")
+    @m.it("Renders values that are not JSON types")
+    def test_json_fallback(self, caplog, reset_structlog):
+        configure_structlog(json=True)
+
+        with caplog.at_level(logging.INFO):
+            structlog.get_logger("test_json_fallback").info(
+                "Fallback", value={1}, counts={1: "one"}
+            )
+
+        entry = log_entry(caplog, "Fallback")
+        assert entry["value"] == "{1}"
+        assert entry["counts"] == {"1": "one"}
+
+    @m.context("When rendering JSON")
+    @m.it("Does not render dataclass fields excluded from the representation")
+    def test_json_dataclass_secret(self, caplog, reset_structlog):
+        configure_structlog(json=True)
+
+        with caplog.at_level(logging.INFO):
+            structlog.get_logger("test_json_dataclass_secret").info(
+                "Dataclass", config=SecretConfig(user="user1", secret="SECRET_VALUE")
+            )
+
+        assert "SECRET_VALUE" not in caplog.text
+        assert log_entry(caplog, "Dataclass")["config"] == "SecretConfig(user='user1')"
+
+    @m.context("When rendering JSON")
+    @m.it("Renders datetimes by their representation, as the json module does")
+    def test_json_datetime(self, caplog, reset_structlog):
+        configure_structlog(json=True)
+        when = datetime(2022, 1, 30, 11, 11, 3)
+
+        with caplog.at_level(logging.INFO):
+            structlog.get_logger("test_json_datetime").info("Datetime", when=when)
+
+        assert log_entry(caplog, "Datetime")["when"] == repr(when)
+
+    @m.context("When rendering JSON")
+    @m.it("Renders integers outside the 64-bit range")
+    def test_json_big_integer(self, caplog, reset_structlog):
+        configure_structlog(json=True)
+
+        with caplog.at_level(logging.INFO):
+            structlog.get_logger("test_json_big_integer").info("Big", n=2**70)
+
+        assert log_entry(caplog, "Big")["n"] == 2**70
+
+    @m.context("When a configuration file is provided")
+    @m.it("Configures standard logging from the file")
+    def test_config_file(self, tmp_path, config_logger, reset_structlog):
+        config_file = tmp_path / "logging.json"
+        write_config(config_file, config_logger)
+
+        configure_structlog(config_file=config_file.as_posix())
+
+        assert logging.getLogger(config_logger).level == logging.WARNING
+
+    @m.context("When orjson is not installed")
+    @m.it("Configures logging from a file and renders JSON with the json module")
+    def test_without_orjson(self, tmp_path, caplog, config_logger, reset_structlog):
+        config_file = tmp_path / "logging.json"
+        write_config(config_file, config_logger)
+
+        with patch("npg.log.orjson", None):
+            configure_structlog(config_file=config_file.as_posix(), json=True)
+
+            with caplog.at_level(logging.INFO):
+                structlog.get_logger("test_without_orjson").info(
+                    "No orjson", value={1}, n=2**70
+                )
+
+        assert logging.getLogger(config_logger).level == logging.WARNING
+
+        entry = log_entry(caplog, "No orjson")
+        assert entry["value"] == "{1}"
+        assert entry["n"] == 2**70